@@ -1,5 +1,6 @@
 """The Waste Collection integration."""
 import logging
+import time
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
@@ -23,6 +24,8 @@ from .const import (
     CONF_STREET_ID,
     CONF_STREET_NAME,
     CONF_TOWN_ID,
+    CONF_WASTE_TYPES_CACHE,
+    CONF_WASTE_TYPES_CACHE_TS,
     DOMAIN,
 )
 
@@ -215,6 +218,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
             # If period changed or manual refresh, update selected_waste_types with new IDs
             if period_changed or force_refresh:
+                updated_data = {}
+                updated_options = {}
+
+                # Waste type IDs may change with the period, so refresh the
+                # labels cached for the options flow (same format: id -> name)
+                waste_type_labels = {desc.get('id'): waste_name for waste_name, desc in descriptions.items()}
+                if waste_type_labels != entry.data.get(CONF_WASTE_TYPES_CACHE):
+                    updated_data[CONF_WASTE_TYPES_CACHE] = waste_type_labels
+                    updated_data[CONF_WASTE_TYPES_CACHE_TS] = time.time()
+
                 old_selected_ids = entry.options.get(
                     CONF_SELECTED_WASTE_TYPES,
                     entry.data.get(CONF_SELECTED_WASTE_TYPES, [])
@@ -239,22 +252,25 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                     if new_selected_ids != old_selected_ids:
                         _LOGGER.info("Updating selected_waste_types from %d to %d IDs",
                                     len(old_selected_ids), len(new_selected_ids))
-
-                        # Update both data and options (sensors will read dynamically)
-                        hass.config_entries.async_update_entry(
-                            entry,
-                            data={
-                                **entry.data,
-                                CONF_SELECTED_WASTE_TYPES: new_selected_ids,
-                            },
-                            options={
-                                **entry.options,
-                                CONF_SELECTED_WASTE_TYPES: new_selected_ids,
-                            }
-                        )
+                        updated_data[CONF_SELECTED_WASTE_TYPES] = new_selected_ids
+                        updated_options[CONF_SELECTED_WASTE_TYPES] = new_selected_ids
                 else:
                     _LOGGER.warning("selected_waste_types is empty - aggregate sensors will not be created")
 
+                if updated_data:
+                    # Update both data and options (sensors will read dynamically)
+                    hass.config_entries.async_update_entry(
+                        entry,
+                        data={
+                            **entry.data,
+                            **updated_data,
+                        },
+                        options={
+                            **entry.options,
+                            **updated_options,
+                        }
+                    )
+
             _LOGGER.info("Data update successful: %d waste types, %d total dates",
                         len(schedule),
                         sum(len(dates) for dates in schedule.values()))
@@ -280,6 +296,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "coordinator": coordinator,
         "api": api,
         "sensor_list": [],  # Will be populated when sensors are created
+        "schedule_view": None,  # Derived sensor lookups, rebuilt per data refresh
         "force_building_type_refresh": False,  # Flag for manual refresh
     }
 
@@ -39,7 +39,7 @@ class WasteCollectionAPI:
             'Origin': 'https://pluginv1.dtsolution.pl',
         }
 
-        response = self.session.post(url, data=body.encode('utf-8'), headers=headers)
+        response = self.session.post(url, data=body.encode('utf-8'), headers=headers, timeout=30)
 
         if self.debug:
             _LOGGER.debug("RESPONSE STATUS: %s", response.status_code)
@@ -317,14 +317,18 @@ class WasteCollectionAPI:
                 except (ValueError, TypeError) as e:
                     _LOGGER.warning("Failed to parse month/year: %s/%s - %s", year, month, e)
 
-        # Sort dates and remove duplicates
+        # Sort dates and remove duplicates (sensors rely on sorted dates to bisect)
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
         for waste_name in waste_schedule:
-            waste_schedule[waste_name] = sorted(set(waste_schedule[waste_name]))
-            _LOGGER.debug("Waste type '%s': %d dates from %s to %s",
-                         waste_name,
-                         len(waste_schedule[waste_name]),
-                         waste_schedule[waste_name][0].strftime("%Y-%m-%d") if waste_schedule[waste_name] else "N/A",
-                         waste_schedule[waste_name][-1].strftime("%Y-%m-%d") if waste_schedule[waste_name] else "N/A")
+            dates = sorted(set(waste_schedule[waste_name]))
+            waste_schedule[waste_name] = dates
+            # The date range arguments are formatted eagerly, so skip them unless needed
+            if debug_enabled:
+                _LOGGER.debug("Waste type '%s': %d dates from %s to %s",
+                             waste_name,
+                             len(dates),
+                             dates[0].strftime("%Y-%m-%d") if dates else "N/A",
+                             dates[-1].strftime("%Y-%m-%d") if dates else "N/A")
 
         # Build final descriptions dict (only for types we have schedules for)
         descriptions = {}
@@ -356,9 +360,10 @@ class WasteCollectionAPI:
         self._schedule_cache = waste_schedule
         self._descriptions_cache = descriptions
 
-        _LOGGER.info("Parsed %d waste types with total %d collection dates",
-                    len(waste_schedule),
-                    sum(len(dates) for dates in waste_schedule.values()))
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("Parsed %d waste types with total %d collection dates",
+                        len(waste_schedule),
+                        sum(len(dates) for dates in waste_schedule.values()))
 
         return waste_schedule, descriptions
 
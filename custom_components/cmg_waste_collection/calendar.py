@@ -20,19 +20,11 @@ from .const import (
     DEFAULT_EVENT_TIME,
     DOMAIN,
 )
+from .sensor import capitalize_waste_name
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def capitalize_waste_name(name: str) -> str:
-    """Capitalize waste type name properly."""
-    if not name:
-        return name
-    if sum(1 for c in name if c.isupper()) > 1:
-        return name.title()
-    return name[0].upper() + name[1:].lower() if len(name) > 1 else name.upper()
-
-
 def normalize_polish_text(text: str) -> str:
     """Normalize Polish text - remove diacritics and convert to ASCII.
 
@@ -1,11 +1,15 @@
 """Config flow for Waste Collection integration."""
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+import time
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import callback
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 import homeassistant.helpers.config_validation as cv
 
@@ -26,13 +30,79 @@ from .const import (
     CONF_STREET_NAME,
     CONF_TOWN_ID,
     CONF_TOWN_NAME,
+    CONF_WASTE_TYPES_CACHE,
+    CONF_WASTE_TYPES_CACHE_TS,
+    DATA_FLOW_API,
     DEFAULT_COMMUNITY_ID,
     DEFAULT_EVENT_TIME,
     DOMAIN,
+    FLOW_API_TIMEOUT,
+    WASTE_TYPES_CACHE_TTL,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Time options for calendar events
+_TIME_OPTIONS = MappingProxyType({
+    "all_day": "All day event",
+    "0": "12:00 AM (midnight)",
+    "1": "1:00 AM",
+    "2": "2:00 AM",
+    "3": "3:00 AM",
+    "4": "4:00 AM",
+    "5": "5:00 AM",
+    "6": "6:00 AM",
+    "7": "7:00 AM",
+    "8": "8:00 AM",
+    "9": "9:00 AM",
+    "10": "10:00 AM",
+    "11": "11:00 AM",
+    "12": "12:00 PM (noon)",
+    "13": "1:00 PM",
+    "14": "2:00 PM",
+    "15": "3:00 PM",
+    "16": "4:00 PM",
+    "17": "5:00 PM",
+    "18": "6:00 PM",
+    "19": "7:00 PM",
+    "20": "8:00 PM",
+    "21": "9:00 PM",
+    "22": "10:00 PM",
+    "23": "11:00 PM",
+})
+
+_TIME_IN = vol.In(_TIME_OPTIONS)
+
+# Forms whose fields do not depend on API data
+_USER_SCHEMA = vol.Schema({
+    vol.Required(CONF_COMMUNITY_ID, default=DEFAULT_COMMUNITY_ID): str,
+})
+_NUMBER_SCHEMA = vol.Schema({
+    vol.Required(CONF_NUMBER): str,
+})
+
+# Shared read-only errors mapping for forms shown without errors
+_NO_ERRORS: Dict[str, str] = {}
+
+_get_id = itemgetter('id')
+_get_name = itemgetter('name')
+_get_choosed_ids = itemgetter('choosedStreetIds')
+
+
+async def _async_call_api(hass: HomeAssistant, func: Callable[..., Any], *args: Any) -> Any:
+    """Run a blocking API call in the executor, bounded by FLOW_API_TIMEOUT."""
+    return await asyncio.wait_for(
+        hass.async_add_executor_job(func, *args), FLOW_API_TIMEOUT
+    )
+
+
+def _get_flow_api(hass: HomeAssistant) -> WasteCollectionAPI:
+    """Get the API client shared by all config and options flows."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_FLOW_API not in domain_data:
+        domain_data[DATA_FLOW_API] = WasteCollectionAPI()
+    return domain_data[DATA_FLOW_API]
+
 
 class WasteCollectionConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Waste Collection."""
@@ -41,55 +111,55 @@ class WasteCollectionConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     def __init__(self):
         """Initialize the config flow."""
-        self.api = WasteCollectionAPI()
         self.data = {}
+        # Raw API rows for the last rendered list, keyed by the option value
+        self._towns_by_id = {}
+        self._streets_by_id = {}
+        self._groups_by_id = {}
+        self._town_options = {}
+        self._prefetched_period = None
+        self._period_prefetched = False
+        self._waste_type_options = {}
+
+    @property
+    def api(self) -> WasteCollectionAPI:
+        """Get the shared API client (reuses its HTTP session)."""
+        return _get_flow_api(self.hass)
 
     async def async_step_user(
         self, user_input: Optional[Dict[str, Any]] = None
     ) -> FlowResult:
         """Handle the initial step - Community ID."""
-        errors = {}
-
         if user_input is not None:
             self.data[CONF_COMMUNITY_ID] = user_input[CONF_COMMUNITY_ID]
             return await self.async_step_town()
 
-        data_schema = vol.Schema({
-            vol.Required(CONF_COMMUNITY_ID, default=DEFAULT_COMMUNITY_ID): str,
-        })
-
         return self.async_show_form(
             step_id="user",
-            data_schema=data_schema,
-            errors=errors,
+            data_schema=_USER_SCHEMA,
+            errors=_NO_ERRORS,
         )
 
     async def async_step_town(
         self, user_input: Optional[Dict[str, Any]] = None
     ) -> FlowResult:
         """Handle town selection."""
-        errors = {}
-
         if user_input is not None:
-            town_data = user_input["town"].split("|")
-            self.data[CONF_TOWN_ID] = town_data[0]
-            self.data[CONF_TOWN_NAME] = town_data[1] if len(town_data) > 1 else town_data[0]
+            town = self._towns_by_id[user_input["town"]]
+            self.data[CONF_TOWN_ID] = town['id']
+            self.data[CONF_TOWN_NAME] = town['name']
 
-            # Automatically get current period
+            # Automatically get current period (normally prefetched with the towns)
             try:
-                period = await self.hass.async_add_executor_job(
-                    self.api.get_current_period, self.data[CONF_COMMUNITY_ID]
-                )
+                if self._period_prefetched:
+                    period = self._prefetched_period
+                else:
+                    period = await _async_call_api(
+                        self.hass, self.api.get_current_period, self.data[CONF_COMMUNITY_ID]
+                    )
 
                 if not period:
-                    errors["base"] = "no_periods_found"
-                    return self.async_show_form(
-                        step_id="town",
-                        data_schema=vol.Schema({
-                            vol.Required("town"): str,
-                        }),
-                        errors=errors,
-                    )
+                    return self._show_town_form({"base": "no_periods_found"})
 
                 # Save period data
                 self.data[CONF_PERIOD_ID] = period['id']
@@ -106,73 +176,79 @@ class WasteCollectionConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             except Exception as err:
                 _LOGGER.error("Error fetching current period: %s", err)
-                errors["base"] = "api_error"
-                return self.async_show_form(
-                    step_id="town",
-                    data_schema=vol.Schema({
-                        vol.Required("town"): str,
-                    }),
-                    errors=errors,
-                )
+                return self._show_town_form({"base": "api_error"})
 
             return await self.async_step_street()
 
-        try:
-            towns = await self.hass.async_add_executor_job(
-                self.api.get_towns, self.data[CONF_COMMUNITY_ID]
-            )
+        towns, period = await asyncio.gather(
+            _async_call_api(
+                self.hass, self.api.get_towns, self.data[CONF_COMMUNITY_ID]
+            ),
+            _async_call_api(
+                self.hass, self.api.get_current_period, self.data[CONF_COMMUNITY_ID]
+            ),
+            return_exceptions=True,
+        )
+
+        # A failed prefetch only means the period is fetched again on submit
+        if isinstance(period, Exception):
+            _LOGGER.debug("Error prefetching current period: %s", period)
+            self._prefetched_period = None
+            self._period_prefetched = False
+        else:
+            self._prefetched_period = period
+            self._period_prefetched = True
+
+        if isinstance(towns, Exception):
+            _LOGGER.error("Error fetching towns: %s", towns)
+            return await self.async_step_user()
 
+        try:
             if not towns:
-                errors["base"] = "no_towns_found"
                 return await self.async_step_user()
 
-            town_options = {
-                f"{town['id']}|{town['name']}": town['name']
-                for town in towns
-            }
+            self._towns_by_id = dict(zip(map(_get_id, towns), towns))
+            self._town_options = dict(zip(map(_get_id, towns), map(_get_name, towns)))
 
-            data_schema = vol.Schema({
-                vol.Required("town"): vol.In(town_options),
-            })
-
-            return self.async_show_form(
-                step_id="town",
-                data_schema=data_schema,
-                errors=errors,
-            )
+            return self._show_town_form(_NO_ERRORS)
 
         except Exception as err:
             _LOGGER.error("Error fetching towns: %s", err)
-            errors["base"] = "api_error"
             return await self.async_step_user()
 
+    def _show_town_form(self, errors: Dict[str, str]) -> FlowResult:
+        """Show the town selection form for the last fetched towns."""
+        return self.async_show_form(
+            step_id="town",
+            data_schema=vol.Schema({
+                vol.Required("town"): vol.In(self._town_options),
+            }),
+            errors=errors,
+        )
+
     async def async_step_street(
         self, user_input: Optional[Dict[str, Any]] = None
     ) -> FlowResult:
         """Handle street selection."""
-        errors = {}
-
         if user_input is not None:
-            street_parts = user_input["street"].split("|")
-            self.data[CONF_STREET_NAME] = street_parts[0]
-            self.data[CONF_STREET_CHOOSED_IDS] = street_parts[1]
+            street = self._streets_by_id[user_input["street"]]
+            self.data[CONF_STREET_NAME] = street['name']
+            self.data[CONF_STREET_CHOOSED_IDS] = street['choosedStreetIds']
             return await self.async_step_number()
 
         try:
-            streets = await self.hass.async_add_executor_job(
+            streets = await _async_call_api(
+                self.hass,
                 self.api.get_streets,
                 self.data[CONF_TOWN_ID],
                 self.data[CONF_PERIOD_ID]
             )
 
             if not streets:
-                errors["base"] = "no_streets_found"
                 return await self.async_step_town()
 
-            street_options = {
-                f"{s['name']}|{s['choosedStreetIds']}": s['name']
-                for s in streets
-            }
+            self._streets_by_id = dict(zip(map(_get_choosed_ids, streets), streets))
+            street_options = dict(zip(map(_get_choosed_ids, streets), map(_get_name, streets)))
 
             data_schema = vol.Schema({
                 vol.Required("street"): vol.In(street_options),
@@ -181,48 +257,40 @@ class WasteCollectionConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return self.async_show_form(
                 step_id="street",
                 data_schema=data_schema,
-                errors=errors,
+                errors=_NO_ERRORS,
             )
 
         except Exception as err:
             _LOGGER.error("Error fetching streets: %s", err)
-            errors["base"] = "api_error"
             return await self.async_step_town()
 
     async def async_step_number(
         self, user_input: Optional[Dict[str, Any]] = None
     ) -> FlowResult:
         """Handle building number input."""
-        errors = {}
-
         if user_input is not None:
             self.data[CONF_NUMBER] = user_input[CONF_NUMBER]
             return await self.async_step_group()
 
-        data_schema = vol.Schema({
-            vol.Required(CONF_NUMBER): str,
-        })
-
         return self.async_show_form(
             step_id="number",
-            data_schema=data_schema,
-            errors=errors,
+            data_schema=_NUMBER_SCHEMA,
+            errors=_NO_ERRORS,
         )
 
     async def async_step_group(
         self, user_input: Optional[Dict[str, Any]] = None
     ) -> FlowResult:
         """Handle building type/group selection."""
-        errors = {}
-
         if user_input is not None:
-            group_parts = user_input["group"].split("|")
-            self.data[CONF_GROUP_NAME] = group_parts[0]
-            self.data[CONF_STREET_ID] = group_parts[1]
+            group = self._groups_by_id[user_input["group"]]
+            self.data[CONF_GROUP_NAME] = group['name']
+            self.data[CONF_STREET_ID] = group['choosedStreetIds']
             return await self.async_step_waste_types()
 
         try:
-            groups, group_id, streets = await self.hass.async_add_executor_job(
+            groups, group_id, streets = await _async_call_api(
+                self.hass,
                 self.api.get_building_groups,
                 self.data[CONF_STREET_CHOOSED_IDS],
                 self.data[CONF_NUMBER],
@@ -251,10 +319,8 @@ class WasteCollectionConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 self.data[CONF_STREET_ID] = street_id
                 return await self.async_step_waste_types()
 
-            group_options = {
-                f"{g['name']}|{g['choosedStreetIds']}": g['name']
-                for g in groups
-            }
+            self._groups_by_id = dict(zip(map(_get_choosed_ids, groups), groups))
+            group_options = dict(zip(map(_get_choosed_ids, groups), map(_get_name, groups)))
 
             data_schema = vol.Schema({
                 vol.Required("group"): vol.In(group_options),
@@ -263,20 +329,17 @@ class WasteCollectionConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return self.async_show_form(
                 step_id="group",
                 data_schema=data_schema,
-                errors=errors,
+                errors=_NO_ERRORS,
             )
 
         except Exception as err:
             _LOGGER.error("Error fetching groups: %s", err)
-            errors["base"] = "api_error"
             return await self.async_step_number()
 
     async def async_step_waste_types(
         self, user_input: Optional[Dict[str, Any]] = None
     ) -> FlowResult:
         """Handle waste type selection."""
-        errors = {}
-
         if user_input is not None:
             # Save selected waste types
             self.data[CONF_SELECTED_WASTE_TYPES] = user_input.get(
@@ -296,11 +359,16 @@ class WasteCollectionConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             return self.async_create_entry(
                 title=f"{self.data[CONF_TOWN_NAME]} - {self.data[CONF_STREET_NAME]} {self.data[CONF_NUMBER]}",
-                data=self.data,
+                data={
+                    **self.data,
+                    CONF_WASTE_TYPES_CACHE: self._waste_type_options,
+                    CONF_WASTE_TYPES_CACHE_TS: time.time(),
+                },
             )
 
         try:
-            raw_data = await self.hass.async_add_executor_job(
+            raw_data = await _async_call_api(
+                self.hass,
                 self.api.get_waste_types,
                 self.data[CONF_NUMBER],
                 self.data[CONF_STREET_ID],
@@ -312,58 +380,26 @@ class WasteCollectionConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             descriptions = raw_data.get('scheduleDescription', [])
 
             if not descriptions:
-                errors["base"] = "no_waste_types_found"
                 return await self.async_step_group()
 
-            waste_type_options = {
-                desc['id']: desc['name']
-                for desc in descriptions
-            }
-
-            # Time options for calendar events
-            time_options = {
-                "all_day": "All day event",
-                "0": "12:00 AM (midnight)",
-                "1": "1:00 AM",
-                "2": "2:00 AM",
-                "3": "3:00 AM",
-                "4": "4:00 AM",
-                "5": "5:00 AM",
-                "6": "6:00 AM",
-                "7": "7:00 AM",
-                "8": "8:00 AM",
-                "9": "9:00 AM",
-                "10": "10:00 AM",
-                "11": "11:00 AM",
-                "12": "12:00 PM (noon)",
-                "13": "1:00 PM",
-                "14": "2:00 PM",
-                "15": "3:00 PM",
-                "16": "4:00 PM",
-                "17": "5:00 PM",
-                "18": "6:00 PM",
-                "19": "7:00 PM",
-                "20": "8:00 PM",
-                "21": "9:00 PM",
-                "22": "10:00 PM",
-                "23": "11:00 PM",
-            }
+            waste_type_options = dict(zip(map(_get_id, descriptions), map(_get_name, descriptions)))
+            self._waste_type_options = waste_type_options
 
             data_schema = vol.Schema({
                 vol.Optional(
                     CONF_SELECTED_WASTE_TYPES,
-                    default=list(waste_type_options.keys())
+                    default=list(waste_type_options)
                 ): cv.multi_select(waste_type_options),
                 vol.Optional(
                     CONF_EVENT_TIME,
                     default=DEFAULT_EVENT_TIME
-                ): vol.In(time_options),
+                ): _TIME_IN,
             })
 
             return self.async_show_form(
                 step_id="waste_types",
                 data_schema=data_schema,
-                errors=errors,
+                errors=_NO_ERRORS,
                 description_placeholders={
                     "info": "Select waste types for aggregate sensors and calendar event time"
                 }
@@ -371,7 +407,6 @@ class WasteCollectionConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         except Exception as err:
             _LOGGER.error("Error fetching waste types: %s", err)
-            errors["base"] = "api_error"
             return await self.async_step_group()
 
     @staticmethod
@@ -386,35 +421,74 @@ class WasteCollectionConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 class WasteCollectionOptionsFlow(config_entries.OptionsFlow):
     """Handle options flow for Waste Collection."""
 
+    def _get_entry_runtime_data(self) -> Optional[Dict[str, Any]]:
+        """Get hass.data for this entry, if it is loaded."""
+        return self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id)
+
+    def _get_cached_waste_types(self) -> Tuple[Optional[Dict[str, str]], float]:
+        """Get cached waste type labels and when they were fetched.
+
+        Labels refreshed since the entry was loaded take precedence over the
+        ones saved in entry data when it was created.
+        """
+        runtime_data = self._get_entry_runtime_data()
+        if runtime_data and runtime_data.get(CONF_WASTE_TYPES_CACHE):
+            source = runtime_data
+        else:
+            source = self.config_entry.data
+
+        return source.get(CONF_WASTE_TYPES_CACHE), source.get(CONF_WASTE_TYPES_CACHE_TS, 0)
+
+    async def _async_fetch_waste_types(self) -> Dict[str, str]:
+        """Fetch waste type labels from the API and cache them for this entry."""
+        api = _get_flow_api(self.hass)
+        raw_data = await _async_call_api(
+            self.hass,
+            api.get_waste_types,
+            self.config_entry.data[CONF_NUMBER],
+            self.config_entry.data[CONF_STREET_ID],
+            self.config_entry.data[CONF_TOWN_ID],
+            self.config_entry.data[CONF_STREET_NAME],
+            self.config_entry.data[CONF_PERIOD_ID]
+        )
+
+        descriptions = raw_data.get('scheduleDescription', [])
+        waste_type_options = dict(zip(map(_get_id, descriptions), map(_get_name, descriptions)))
+
+        # Kept in hass.data: updating entry data would reload the entry
+        runtime_data = self._get_entry_runtime_data()
+        if runtime_data is not None and waste_type_options:
+            runtime_data[CONF_WASTE_TYPES_CACHE] = waste_type_options
+            runtime_data[CONF_WASTE_TYPES_CACHE_TS] = time.time()
+
+        return waste_type_options
+
+    async def _async_refresh_waste_types(self) -> None:
+        """Refresh stale waste type labels in the background."""
+        try:
+            await self._async_fetch_waste_types()
+        except Exception as err:
+            _LOGGER.warning("Error refreshing waste types in options: %s", err)
+
     async def async_step_init(
         self, user_input: Optional[Dict[str, Any]] = None
     ) -> FlowResult:
         """Manage the options."""
-        errors = {}
-
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
         try:
-            api = WasteCollectionAPI()
-            raw_data = await self.hass.async_add_executor_job(
-                api.get_waste_types,
-                self.config_entry.data[CONF_NUMBER],
-                self.config_entry.data[CONF_STREET_ID],
-                self.config_entry.data[CONF_TOWN_ID],
-                self.config_entry.data[CONF_STREET_NAME],
-                self.config_entry.data[CONF_PERIOD_ID]
-            )
+            # Render from cached labels; only wait for the API when there are none
+            waste_type_options, cache_ts = self._get_cached_waste_types()
 
-            descriptions = raw_data.get('scheduleDescription', [])
-            waste_type_options = {
-                desc['id']: desc['name']
-                for desc in descriptions
-            }
+            if not waste_type_options:
+                waste_type_options = await self._async_fetch_waste_types()
+            elif time.time() - cache_ts >= WASTE_TYPES_CACHE_TTL:
+                self.hass.async_create_task(self._async_refresh_waste_types())
 
             current_selection = self.config_entry.options.get(
                 CONF_SELECTED_WASTE_TYPES,
-                self.config_entry.data.get(CONF_SELECTED_WASTE_TYPES, list(waste_type_options.keys()))
+                self.config_entry.data.get(CONF_SELECTED_WASTE_TYPES, list(waste_type_options))
             )
 
             current_event_time = self.config_entry.options.get(
@@ -427,35 +501,6 @@ class WasteCollectionOptionsFlow(config_entries.OptionsFlow):
                 self.config_entry.data.get(CONF_DEBUG_LOGGING, False)
             )
 
-            # Time options for calendar events
-            time_options = {
-                "all_day": "All day event",
-                "0": "12:00 AM (midnight)",
-                "1": "1:00 AM",
-                "2": "2:00 AM",
-                "3": "3:00 AM",
-                "4": "4:00 AM",
-                "5": "5:00 AM",
-                "6": "6:00 AM",
-                "7": "7:00 AM",
-                "8": "8:00 AM",
-                "9": "9:00 AM",
-                "10": "10:00 AM",
-                "11": "11:00 AM",
-                "12": "12:00 PM (noon)",
-                "13": "1:00 PM",
-                "14": "2:00 PM",
-                "15": "3:00 PM",
-                "16": "4:00 PM",
-                "17": "5:00 PM",
-                "18": "6:00 PM",
-                "19": "7:00 PM",
-                "20": "8:00 PM",
-                "21": "9:00 PM",
-                "22": "10:00 PM",
-                "23": "11:00 PM",
-            }
-
             return self.async_show_form(
                 step_id="init",
                 data_schema=vol.Schema({
@@ -466,13 +511,13 @@ class WasteCollectionOptionsFlow(config_entries.OptionsFlow):
                     vol.Optional(
                         CONF_EVENT_TIME,
                         default=current_event_time
-                    ): vol.In(time_options),
+                    ): _TIME_IN,
                     vol.Optional(
                         CONF_DEBUG_LOGGING,
                         default=current_debug_logging
                     ): bool,
                 }),
-                errors=errors,
+                errors=_NO_ERRORS,
                 description_placeholders={
                     "info": "Select which waste types to include in aggregate sensors"
                 }
@@ -480,9 +525,8 @@ class WasteCollectionOptionsFlow(config_entries.OptionsFlow):
 
         except Exception as err:
             _LOGGER.error("Error fetching waste types in options: %s", err)
-            errors["base"] = "api_error"
             return self.async_show_form(
                 step_id="init",
                 data_schema=vol.Schema({}),
-                errors=errors,
+                errors={"base": "api_error"},
             )
\ No newline at end of file
@@ -2,6 +2,10 @@
 
 DOMAIN = "cmg_waste_collection"
 
+# hass.data[DOMAIN] key for the API client shared by config and options
+# flows; not a config entry ID, so skip it when iterating over entries
+DATA_FLOW_API = "_flow_api"
+
 # API
 BASE_URL = "https://pluginecoapi.ecoharmonogram.pl/v1"
 
@@ -22,9 +26,17 @@ CONF_SELECTED_WASTE_TYPES = "selected_waste_types"
 CONF_EVENT_TIME = "event_time"
 CONF_DEBUG_LOGGING = "debug_logging"
 
+# Waste type labels cached in entry data for the options flow
+CONF_WASTE_TYPES_CACHE = "_waste_types_cache"
+CONF_WASTE_TYPES_CACHE_TS = "_waste_types_ts"
+
 # Defaults
 DEFAULT_COMMUNITY_ID = "108"
 DEFAULT_EVENT_TIME = "6"  # Default to 6:00 AM
+WASTE_TYPES_CACHE_TTL = 86400  # 24 hours, in seconds
+# Upper bound for one API call made while a flow form is open. Longer than
+# the API client's 30 second socket timeout, so its own errors surface first.
+FLOW_API_TIMEOUT = 35  # seconds
 
 # Sensor attributes
 ATTR_NEXT_DATE = "next_date"
@@ -1,11 +1,14 @@
 """Sensor platform for Waste Collection."""
-from datetime import datetime, timedelta
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 import logging
-from typing import Any, Dict, List, Optional
+from operator import itemgetter
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
 
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
@@ -43,14 +46,188 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
+def _count_upper_capped(text: str) -> int:
+    """Count uppercase characters, stopping once more than one is found."""
+    count = 0
+    for c in text:
+        if c.isupper():
+            count += 1
+            if count > 1:
+                return count
+    return count
+
+
+@lru_cache(maxsize=256)
 def capitalize_waste_name(name: str) -> str:
     """Capitalize waste type name properly - first letter uppercase, rest lowercase."""
     if not name:
         return name
     # Skip if already has multiple capital letters (like METALE I TWORZYWA)
-    if sum(1 for c in name if c.isupper()) > 1:
+    if _count_upper_capped(name) > 1:
         return name.title()
-    return name[0].upper() + name[1:].lower() if len(name) > 1 else name.upper()
+    return name.capitalize()
+
+
+# Used to build waste type unique IDs ("Odpady zielone" -> "odpady_zielone")
+_SPACE_TO_UNDERSCORE = str.maketrans(" ", "_")
+
+# Waste type name keywords -> icon, first match wins
+_ICON_RULES = (
+    (("bio",), "mdi:leaf"),
+    (("odpady", "zielone"), "mdi:grass"),
+    (("papier",), "mdi:newspaper"),
+    (("szkło",), "mdi:bottle-wine"),
+    (("metale", "tworzywa"), "mdi:recycle"),
+    (("resztkowe", "zmieszane"), "mdi:trash-can"),
+    (("gabaryty",), "mdi:truck"),
+    (("płatności", "terminy"), "mdi:cash"),
+)
+
+
+@lru_cache(maxsize=128)
+def _icon_for(waste_lower: str) -> str:
+    """Get icon for a lowercased waste type name."""
+    for keywords, icon in _ICON_RULES:
+        if any(keyword in waste_lower for keyword in keywords):
+            return icon
+    return "mdi:delete"
+
+
+class _Aggregates(NamedTuple):
+    """Collections of the selected waste types, relative to one day.
+
+    Waste types are given by their capitalized names, ready for display.
+    """
+
+    today_names: Tuple[str, ...]
+    tomorrow_names: Tuple[str, ...]
+    next_date: Optional[datetime]
+    next_names: Tuple[str, ...]
+
+
+class _ScheduleView:
+    """Lookups derived from one coordinator data object.
+
+    Built once per refresh and shared by all sensors of a config entry.
+    """
+
+    def __init__(
+        self,
+        data: Tuple[Dict[str, List[datetime]], Dict[str, Dict[str, Any]]],
+        selected_ids: FrozenSet[str],
+    ) -> None:
+        """Derive the lookups from the schedule and descriptions."""
+        schedule, descriptions = data
+        self.data = data
+        # Waste type -> ID, so the selection filters need one dict probe
+        self._type_ids: Dict[str, Any] = {
+            waste_type: desc.get('id') for waste_type, desc in descriptions.items()
+        }
+        self.monitored_names = tuple(
+            capitalize_waste_name(waste_type)
+            for waste_type, type_id in self._type_ids.items()
+            if type_id in selected_ids
+        )
+        # Selected waste types, in schedule order
+        self._selected_types = [
+            waste_type for waste_type in schedule
+            if self._type_ids.get(waste_type) in selected_ids
+        ]
+
+        # ISO strings per waste type, index-aligned with the schedule lists;
+        # tuples, since the sensors expose them as attributes
+        self.date_strings: Dict[str, Tuple[str, ...]] = {
+            waste_type: tuple(d.date().isoformat() for d in dates)
+            for waste_type, dates in schedule.items()
+        }
+        # Collection days per waste type, for membership tests
+        self._day_sets: Dict[str, FrozenSet[date]] = {
+            waste_type: frozenset(d.date() for d in dates)
+            for waste_type, dates in schedule.items()
+        }
+
+        # All collections of the selected types as one date-sorted list, with
+        # a parallel list of days for bisecting. sorted() is stable, so types
+        # collected on the same day keep their schedule order.
+        self._collections: List[Tuple[datetime, str]] = sorted(
+            (
+                (collection_date, waste_type)
+                for waste_type in self._selected_types
+                for collection_date in schedule[waste_type]
+            ),
+            key=itemgetter(0),
+        )
+        self._collection_days = [
+            collection_date.date() for collection_date, _ in self._collections
+        ]
+        # Last get_aggregates() result, with the day it was computed for
+        self._aggregates: Optional[Tuple[date, _Aggregates]] = None
+
+    def get_aggregates(self, today: date) -> _Aggregates:
+        """Get today's, tomorrow's and the next collections of the selected types.
+
+        The today, tomorrow and next collection sensors update together, so
+        the result is computed by whichever runs first and reused by the others.
+        """
+        if self._aggregates is not None and self._aggregates[0] == today:
+            return self._aggregates[1]
+
+        day_sets = self._day_sets
+        tomorrow = today + timedelta(days=1)
+        today_names = tuple(
+            capitalize_waste_name(waste_type) for waste_type in self._selected_types
+            if today in day_sets[waste_type]
+        )
+        tomorrow_names = tuple(
+            capitalize_waste_name(waste_type) for waste_type in self._selected_types
+            if tomorrow in day_sets[waste_type]
+        )
+
+        # First collection on or after today, plus every type due that day
+        days = self._collection_days
+        next_date = None
+        next_names: Tuple[str, ...] = ()
+        idx = bisect_left(days, today)
+        if idx < len(days):
+            end = bisect_right(days, days[idx], idx)
+            next_date = self._collections[idx][0]
+            next_names = tuple(
+                capitalize_waste_name(waste_type)
+                for _, waste_type in self._collections[idx:end]
+            )
+
+        aggregates = _Aggregates(today_names, tomorrow_names, next_date, next_names)
+        self._aggregates = (today, aggregates)
+        return aggregates
+
+
+def _get_selected_type_ids(config_entry: ConfigEntry) -> List[str]:
+    """Get the waste type IDs selected for the aggregate sensors."""
+    return config_entry.options.get(
+        CONF_SELECTED_WASTE_TYPES,
+        config_entry.data.get(CONF_SELECTED_WASTE_TYPES, [])
+    )
+
+
+def _get_schedule_view(
+    coordinator: DataUpdateCoordinator, config_entry: ConfigEntry
+) -> Optional[_ScheduleView]:
+    """Get the schedule view for the coordinator's current data.
+
+    Kept in the entry's hass.data, so it is dropped with the entry on unload.
+    Options changes reload the entry, so the selection is fixed per view.
+    """
+    data = coordinator.data
+    if not data:
+        return None
+
+    entry_data = coordinator.hass.data[DOMAIN].get(config_entry.entry_id)
+    view = entry_data.get("schedule_view") if entry_data is not None else None
+    if view is None or view.data is not data:
+        view = _ScheduleView(data, frozenset(_get_selected_type_ids(config_entry)))
+        if entry_data is not None:
+            entry_data["schedule_view"] = view
+    return view
 
 
 async def async_setup_entry(
@@ -71,22 +248,21 @@ async def async_setup_entry(
 
     schedule, descriptions = coordinator.data
 
-    # Clear sensor list (in case of reload)
-    hass.data[DOMAIN][config_entry.entry_id]["sensor_list"] = []
+    # Build sensor list, replacing the one from before a reload
+    # (slugify matches HA's entity_id normalization)
+    sensor_list = [
+        f"sensor.waste_collection_{slugify(waste_type)}" for waste_type in descriptions
+    ]
+    hass.data[DOMAIN][config_entry.entry_id]["sensor_list"] = sensor_list
 
     # Create sensor for each waste type
-    for waste_type, desc in descriptions.items():
-        # Use slugify to match HA's entity_id normalization
-        waste_slug = slugify(waste_type)
-        entity_id = f"sensor.waste_collection_{waste_slug}"
-
-        # Add to sensor list
-        hass.data[DOMAIN][config_entry.entry_id]["sensor_list"].append(entity_id)
-
-        entities.append(
-            WasteCollectionSensor(coordinator, config_entry, waste_type, desc)
-        )
-        _LOGGER.debug("Created sensor '%s' with entity_id: %s", waste_type, entity_id)
+    entities.extend(
+        WasteCollectionSensor(coordinator, config_entry, waste_type, desc)
+        for waste_type, desc in descriptions.items()
+    )
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        for waste_type, entity_id in zip(descriptions, sensor_list):
+            _LOGGER.debug("Created sensor '%s' with entity_id: %s", waste_type, entity_id)
 
     # Create sensor that lists all waste sensors (for card)
     entities.append(
@@ -94,24 +270,20 @@ async def async_setup_entry(
     )
 
     _LOGGER.info("Created %d waste type sensors, list: %s",
-                 len(hass.data[DOMAIN][config_entry.entry_id]["sensor_list"]),
-                 hass.data[DOMAIN][config_entry.entry_id]["sensor_list"])
+                 len(sensor_list), sensor_list)
 
     # Create aggregate sensors
-    selected_types = config_entry.options.get(
-        CONF_SELECTED_WASTE_TYPES,
-        config_entry.data.get(CONF_SELECTED_WASTE_TYPES, [])
-    )
+    selected_types = _get_selected_type_ids(config_entry)
 
     if selected_types:
         entities.append(
-            TodayCollectionSensor(coordinator, config_entry, selected_types)
+            TodayCollectionSensor(coordinator, config_entry)
         )
         entities.append(
-            TomorrowCollectionSensor(coordinator, config_entry, selected_types)
+            TomorrowCollectionSensor(coordinator, config_entry)
         )
         entities.append(
-            NextCollectionSensor(coordinator, config_entry, selected_types)
+            NextCollectionSensor(coordinator, config_entry)
         )
         _LOGGER.info("Created aggregate sensors with %d selected waste types", len(selected_types))
     else:
@@ -141,11 +313,22 @@ async def async_setup_entry(
 
 def get_device_info(config_entry: ConfigEntry) -> DeviceInfo:
     """Get device info for all entities."""
+    return _get_device_info(
+        config_entry.entry_id,
+        config_entry.data.get(CONF_TOWN_NAME, 'Unknown'),
+        config_entry.data.get(CONF_STREET_NAME, ''),
+        config_entry.data.get(CONF_NUMBER, ''),
+    )
+
+
+@lru_cache(maxsize=32)
+def _get_device_info(entry_id: str, town_name: str, street_name: str, number: str) -> DeviceInfo:
+    """Build device info once per entry; all sensors of the entry share it."""
     return DeviceInfo(
-        identifiers={(DOMAIN, config_entry.entry_id)},
+        identifiers={(DOMAIN, entry_id)},
         name="Waste Collection",
         manufacturer="EcoHarmonogram.pl",
-        model=f"{config_entry.data.get(CONF_TOWN_NAME, 'Unknown')} - {config_entry.data.get(CONF_STREET_NAME, '')} {config_entry.data.get(CONF_NUMBER, '')}",
+        model=f"{town_name} - {street_name} {number}",
         sw_version="3.0",
         configuration_url="https://ecoharmonogram.pl",
         entry_type="service",
@@ -169,52 +352,47 @@ class WasteCollectionSensor(CoordinatorEntity, SensorEntity):
         self._config_entry = config_entry
         self._attr_name = capitalize_waste_name(waste_type)
         self._attr_unique_id = (
-            f"{config_entry.entry_id}_{waste_type.lower().replace(' ', '_')}"
+            f"{config_entry.entry_id}_{waste_type.lower().translate(_SPACE_TO_UNDERSCORE)}"
         )
-        self._attr_icon = self._get_icon(waste_type)
+        self._attr_icon = _icon_for(waste_type.lower())
         self._attr_has_entity_name = True
         self._attr_device_info = get_device_info(config_entry)
+        # Coordinator data object and day the current state was computed for
+        self._state_stamp: Optional[Tuple[Any, date]] = None
+        self._update_state()
 
-    def _get_icon(self, waste_type: str) -> str:
-        """Get icon based on waste type."""
-        waste_lower = waste_type.lower()
-
-        if "bio" in waste_lower:
-            return "mdi:leaf"
-        elif "odpady" in waste_lower or "zielone" in waste_lower:
-            return "mdi:grass"
-        elif "papier" in waste_lower:
-            return "mdi:newspaper"
-        elif "szkło" in waste_lower:
-            return "mdi:bottle-wine"
-        elif "metale" in waste_lower or "tworzywa" in waste_lower:
-            return "mdi:recycle"
-        elif "resztkowe" in waste_lower or "zmieszane" in waste_lower:
-            return "mdi:trash-can"
-        elif "gabaryty" in waste_lower:
-            return "mdi:truck"
-        elif "płatności" in waste_lower or "terminy" in waste_lower:
-            return "mdi:cash"
-        else:
-            return "mdi:delete"
+    def _update_state(self) -> None:
+        """Compute cached state from the current coordinator data."""
+        data = self.coordinator.data
+        today = dt_util.now().date()
+        # A failed refresh notifies the sensors but keeps the same data
+        stamp = self._state_stamp
+        if stamp is not None and stamp[0] is data and stamp[1] == today:
+            return
+        self._state_stamp = (data, today)
 
-    @property
-    def native_value(self) -> Optional[str]:
-        """Return the state of the sensor."""
-        next_date = self._get_next_collection()
-        if next_date:
-            return next_date.strftime("%Y-%m-%d")
-        return None
+        # Keep showing last known values even if update fails
+        self._attr_available = data is not None
+        next_date, idx = self._get_collection_info(today)
+        self._attr_native_value = next_date.date().isoformat() if next_date else None
+        self._attr_extra_state_attributes = self._build_extra_state_attributes(
+            today, next_date, idx
+        )
 
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return additional attributes."""
-        next_date = self._get_next_collection()
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_state()
+        super()._handle_coordinator_update()
+
+    def _build_extra_state_attributes(
+        self, today: date, next_date: Optional[datetime], idx: int
+    ) -> Dict[str, Any]:
+        """Build additional attributes from the coordinator data."""
 
         base_attrs = {
             ATTR_WASTE_TYPE_ID: self._description.get('id'),
             ATTR_COLOR: self._description.get('color'),
-            'icon': self._attr_icon,
         }
 
         if not next_date:
@@ -224,63 +402,48 @@ class WasteCollectionSensor(CoordinatorEntity, SensorEntity):
                 ATTR_DAYS_UNTIL: None,
                 ATTR_IS_TODAY: False,
                 ATTR_IS_TOMORROW: False,
-                ATTR_UPCOMING_DATES: [],
-                ATTR_ALL_DATES: [],
+                ATTR_UPCOMING_DATES: (),
+                ATTR_ALL_DATES: (),
             }
 
-        today = dt_util.now().date()
         days_until = (next_date.date() - today).days
-
-        all_dates = self._get_all_dates()
-        upcoming = [
-            d.strftime("%Y-%m-%d")
-            for d in all_dates
-            if d.date() >= today
-        ][:3]
+        view = _get_schedule_view(self.coordinator, self._config_entry)
+        date_strings = view.date_strings[self._waste_type]
 
         return {
             **base_attrs,
-            ATTR_NEXT_DATE: next_date.strftime("%Y-%m-%d"),
+            ATTR_NEXT_DATE: date_strings[idx],
             ATTR_DAYS_UNTIL: days_until,
             ATTR_IS_TODAY: days_until == 0,
             ATTR_IS_TOMORROW: days_until == 1,
-            ATTR_UPCOMING_DATES: upcoming,
-            ATTR_ALL_DATES: [d.strftime("%Y-%m-%d") for d in all_dates],
+            ATTR_UPCOMING_DATES: date_strings[idx:idx + 3],
+            ATTR_ALL_DATES: date_strings,
         }
 
-    def _get_next_collection(self) -> Optional[datetime]:
-        """Get next collection date for this waste type."""
+    def _get_collection_info(self, today: date) -> Tuple[Optional[datetime], int]:
+        """Get the next collection date for this waste type and its schedule index."""
         if not self.coordinator.data:
-            return None
+            return None, 0
 
         schedule, _ = self.coordinator.data
-        dates = schedule.get(self._waste_type, [])
+        all_dates = schedule.get(self._waste_type, [])
 
-        if not dates:
-            return None
+        # Dates are sorted by the API client, so the first future date can be
+        # found by bisecting on midnight of today
+        next_date = None
+        idx = 0
+        if all_dates:
+            today_start = datetime.combine(today, time.min, tzinfo=all_dates[0].tzinfo)
+            idx = bisect_left(all_dates, today_start)
+            if idx < len(all_dates):
+                next_date = all_dates[idx]
 
-        today = dt_util.now().date()
-        future_dates = [d for d in dates if d.date() >= today]
-
-        if future_dates:
-            return future_dates[0]
-
-        return None
-
-    def _get_all_dates(self) -> List[datetime]:
-        """Get all collection dates for this waste type."""
-        if not self.coordinator.data:
-            return []
-
-        schedule, _ = self.coordinator.data
-        dates = schedule.get(self._waste_type, [])
-        return dates
+        return next_date, idx
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        # Keep showing last known values even if update fails
-        return self.coordinator.data is not None
+        return self._attr_available
 
 
 class TodayCollectionSensor(CoordinatorEntity, SensorEntity):
@@ -290,75 +453,55 @@ class TodayCollectionSensor(CoordinatorEntity, SensorEntity):
         self,
         coordinator: DataUpdateCoordinator,
         config_entry: ConfigEntry,
-        selected_type_ids: List[str],
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._config_entry = config_entry
-        # Don't store selected_type_ids - read dynamically from config_entry
         self._attr_name = "Today collection"
         self._attr_unique_id = f"{config_entry.entry_id}_today_collection"
         self._attr_icon = "mdi:calendar-today"
         self._attr_has_entity_name = True
         self._attr_device_info = get_device_info(config_entry)
+        self._update_state()
 
-    @property
-    def _selected_type_ids(self) -> List[str]:
-        """Get current selected type IDs from config entry."""
-        return self._config_entry.options.get(
-            CONF_SELECTED_WASTE_TYPES,
-            self._config_entry.data.get(CONF_SELECTED_WASTE_TYPES, [])
-        )
-
-    @property
-    def native_value(self) -> str:
-        """Return the state of the sensor."""
-        today_types = self._get_today_types()
-        return "Yes" if today_types else "No"
-
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return additional attributes."""
-        today_types = self._get_today_types()
-
+    def _update_state(self) -> None:
+        """Compute cached state from the current coordinator data."""
+        # Keep showing last known values even if update fails
+        self._attr_available = self.coordinator.data is not None
+        today_names = self._get_today_names(dt_util.now().date())
+        self._attr_native_value = "Yes" if today_names else "No"
+        self._attr_extra_state_attributes = self._build_extra_state_attributes(today_names)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_state()
+        super()._handle_coordinator_update()
+
+    def _build_extra_state_attributes(self, today_names: Tuple[str, ...]) -> Dict[str, Any]:
+        """Build additional attributes from the coordinator data."""
         # Get all monitored waste type names
-        monitored_types = []
-        if self.coordinator.data:
-            _, descriptions = self.coordinator.data
-            for waste_type, desc in descriptions.items():
-                if desc.get('id') in self._selected_type_ids:
-                    monitored_types.append(capitalize_waste_name(waste_type))
+        view = _get_schedule_view(self.coordinator, self._config_entry)
+        monitored_types = view.monitored_names if view is not None else ()
 
         return {
-            ATTR_WASTE_TYPES: [capitalize_waste_name(t) for t in today_types],
-            ATTR_COUNT: len(today_types),
+            ATTR_WASTE_TYPES: today_names,
+            ATTR_COUNT: len(today_names),
             "monitored_types": monitored_types,
         }
 
-    def _get_today_types(self) -> List[str]:
-        """Get list of waste types collected today from selected."""
-        if not self.coordinator.data:
-            return []
-
-        schedule, descriptions = self.coordinator.data
-        today = dt_util.now().date()
-        today_types = []
-
-        for waste_type, dates in schedule.items():
-            desc = descriptions.get(waste_type, {})
-            if desc.get('id') not in self._selected_type_ids:
-                continue
+    def _get_today_names(self, today: date) -> Tuple[str, ...]:
+        """Get names of the selected waste types collected today."""
+        view = _get_schedule_view(self.coordinator, self._config_entry)
+        if view is None:
+            return ()
 
-            if any(d.date() == today for d in dates):
-                today_types.append(waste_type)
-
-        return today_types
+        return view.get_aggregates(today).today_names
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        # Keep showing last known values even if update fails
-        return self.coordinator.data is not None
+        return self._attr_available
 
 
 class TomorrowCollectionSensor(CoordinatorEntity, SensorEntity):
@@ -368,76 +511,55 @@ class TomorrowCollectionSensor(CoordinatorEntity, SensorEntity):
         self,
         coordinator: DataUpdateCoordinator,
         config_entry: ConfigEntry,
-        selected_type_ids: List[str],
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._config_entry = config_entry
-        # Don't store selected_type_ids - read dynamically from config_entry
         self._attr_name = "Tomorrow collection"
         self._attr_unique_id = f"{config_entry.entry_id}_tomorrow_collection"
         self._attr_icon = "mdi:calendar"
         self._attr_has_entity_name = True
         self._attr_device_info = get_device_info(config_entry)
+        self._update_state()
 
-    @property
-    def _selected_type_ids(self) -> List[str]:
-        """Get current selected type IDs from config entry."""
-        return self._config_entry.options.get(
-            CONF_SELECTED_WASTE_TYPES,
-            self._config_entry.data.get(CONF_SELECTED_WASTE_TYPES, [])
-        )
-
-    @property
-    def native_value(self) -> str:
-        """Return the state of the sensor."""
-        tomorrow_types = self._get_tomorrow_types()
-        return "Yes" if tomorrow_types else "No"
-
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return additional attributes."""
-        tomorrow_types = self._get_tomorrow_types()
-
+    def _update_state(self) -> None:
+        """Compute cached state from the current coordinator data."""
+        # Keep showing last known values even if update fails
+        self._attr_available = self.coordinator.data is not None
+        tomorrow_names = self._get_tomorrow_names(dt_util.now().date())
+        self._attr_native_value = "Yes" if tomorrow_names else "No"
+        self._attr_extra_state_attributes = self._build_extra_state_attributes(tomorrow_names)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_state()
+        super()._handle_coordinator_update()
+
+    def _build_extra_state_attributes(self, tomorrow_names: Tuple[str, ...]) -> Dict[str, Any]:
+        """Build additional attributes from the coordinator data."""
         # Get all monitored waste type names
-        monitored_types = []
-        if self.coordinator.data:
-            _, descriptions = self.coordinator.data
-            for waste_type, desc in descriptions.items():
-                if desc.get('id') in self._selected_type_ids:
-                    monitored_types.append(capitalize_waste_name(waste_type))
+        view = _get_schedule_view(self.coordinator, self._config_entry)
+        monitored_types = view.monitored_names if view is not None else ()
 
         return {
-            ATTR_WASTE_TYPES: [capitalize_waste_name(t) for t in tomorrow_types],
-            ATTR_COUNT: len(tomorrow_types),
+            ATTR_WASTE_TYPES: tomorrow_names,
+            ATTR_COUNT: len(tomorrow_names),
             "monitored_types": monitored_types,
         }
 
-    def _get_tomorrow_types(self) -> List[str]:
-        """Get list of waste types collected tomorrow from selected."""
-        if not self.coordinator.data:
-            return []
+    def _get_tomorrow_names(self, today: date) -> Tuple[str, ...]:
+        """Get names of the selected waste types collected tomorrow."""
+        view = _get_schedule_view(self.coordinator, self._config_entry)
+        if view is None:
+            return ()
 
-        schedule, descriptions = self.coordinator.data
-        today = dt_util.now().date()
-        tomorrow = today + timedelta(days=1)
-        tomorrow_types = []
-
-        for waste_type, dates in schedule.items():
-            desc = descriptions.get(waste_type, {})
-            if desc.get('id') not in self._selected_type_ids:
-                continue
-
-            if any(d.date() == tomorrow for d in dates):
-                tomorrow_types.append(waste_type)
-
-        return tomorrow_types
+        return view.get_aggregates(today).tomorrow_names
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        # Keep showing last known values even if update fails
-        return self.coordinator.data is not None
+        return self._attr_available
 
 
 class NextCollectionSensor(CoordinatorEntity, SensorEntity):
@@ -447,115 +569,81 @@ class NextCollectionSensor(CoordinatorEntity, SensorEntity):
         self,
         coordinator: DataUpdateCoordinator,
         config_entry: ConfigEntry,
-        selected_type_ids: List[str],
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._config_entry = config_entry
-        # Don't store selected_type_ids - read dynamically from config_entry
         self._attr_name = "Next collection"
         self._attr_unique_id = f"{config_entry.entry_id}_next_collection"
         self._attr_icon = "mdi:calendar-multiselect"
         self._attr_has_entity_name = True
         self._attr_device_info = get_device_info(config_entry)
+        self._update_state()
 
-    @property
-    def _selected_type_ids(self) -> List[str]:
-        """Get current selected type IDs from config entry."""
-        return self._config_entry.options.get(
-            CONF_SELECTED_WASTE_TYPES,
-            self._config_entry.data.get(CONF_SELECTED_WASTE_TYPES, [])
-        )
-
-    @property
-    def native_value(self) -> Optional[str]:
-        """Return the state of the sensor (next date)."""
-        next_info = self._get_next_collection()
-        if next_info:
-            return next_info['date'].strftime("%Y-%m-%d")
-        return None
-
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return additional attributes."""
-        next_info = self._get_next_collection()
-
+    def _update_state(self) -> None:
+        """Compute cached state from the current coordinator data."""
+        # Keep showing last known values even if update fails
+        self._attr_available = self.coordinator.data is not None
+        today = dt_util.now().date()
+        next_info = self._get_next_collection(today)
+        self._attr_native_value = next_info['date'].date().isoformat() if next_info else None
+        self._attr_extra_state_attributes = self._build_extra_state_attributes(today, next_info)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_state()
+        super()._handle_coordinator_update()
+
+    def _build_extra_state_attributes(
+        self, today: date, next_info: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Build additional attributes from the coordinator data."""
         # Get all monitored waste type names
-        monitored_types = []
-        if self.coordinator.data:
-            _, descriptions = self.coordinator.data
-            for waste_type, desc in descriptions.items():
-                if desc.get('id') in self._selected_type_ids:
-                    monitored_types.append(capitalize_waste_name(waste_type))
+        view = _get_schedule_view(self.coordinator, self._config_entry)
+        monitored_types = view.monitored_names if view is not None else ()
 
         if not next_info:
             return {
                 ATTR_NEXT_TYPE: None,
-                ATTR_WASTE_TYPES: [],
+                ATTR_WASTE_TYPES: (),
                 ATTR_DAYS_UNTIL: None,
                 ATTR_IS_TODAY: False,
                 ATTR_IS_TOMORROW: False,
                 "monitored_types": monitored_types,
             }
 
-        today = dt_util.now().date()
         days_until = (next_info['date'].date() - today).days
 
         return {
-            ATTR_NEXT_TYPE: capitalize_waste_name(next_info['types'][0]) if next_info['types'] else None,
-            ATTR_WASTE_TYPES: [capitalize_waste_name(t) for t in next_info['types']],
+            ATTR_NEXT_TYPE: next_info['types'][0] if next_info['types'] else None,
+            ATTR_WASTE_TYPES: next_info['types'],
             ATTR_DAYS_UNTIL: days_until,
             ATTR_IS_TODAY: days_until == 0,
             ATTR_IS_TOMORROW: days_until == 1,
             "monitored_types": monitored_types,
         }
 
-    def _get_next_collection(self) -> Optional[Dict[str, Any]]:
-        """Get next collection info."""
-        if not self.coordinator.data:
+    def _get_next_collection(self, today: date) -> Optional[Dict[str, Any]]:
+        """Get next collection date and the names of the types due that day."""
+        view = _get_schedule_view(self.coordinator, self._config_entry)
+        if view is None:
             return None
 
-        schedule, descriptions = self.coordinator.data
-        today = dt_util.now().date()
-        selected_ids = self._selected_type_ids
-
-        future_collections = []
-
-        for waste_type, dates in schedule.items():
-            desc = descriptions.get(waste_type, {})
-            waste_id = desc.get('id')
-            if waste_id not in selected_ids:
-                continue
-
-            future_dates = [d for d in dates if d.date() >= today]
-            if future_dates:
-                future_collections.append({
-                    'type': waste_type,
-                    'date': future_dates[0]
-                })
-
-        if not future_collections:
+        aggregates = view.get_aggregates(today)
+        if aggregates.next_date is None:
             _LOGGER.warning("No future collections found for selected waste types")
             return None
 
-        future_collections.sort(key=lambda x: x['date'])
-        next_date = future_collections[0]['date']
-
-        types_on_date = [
-            c['type'] for c in future_collections
-            if c['date'].date() == next_date.date()
-        ]
-
         return {
-            'date': next_date,
-            'types': types_on_date
+            'date': aggregates.next_date,
+            'types': aggregates.next_names,
         }
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        # Keep showing last known values even if update fails
-        return self.coordinator.data is not None
+        return self._attr_available
 
 
 class ScheduleChangeDateSensor(SensorEntity):
@@ -564,23 +652,15 @@ class ScheduleChangeDateSensor(SensorEntity):
     def __init__(self, config_entry: ConfigEntry, change_date: str) -> None:
         """Initialize the sensor."""
         self._config_entry = config_entry
-        self._change_date = change_date
         self._attr_name = "Schedule last change"
         self._attr_unique_id = f"{config_entry.entry_id}_schedule_change_date"
         self._attr_icon = "mdi:calendar-edit"
         self._attr_has_entity_name = True
         self._attr_device_info = get_device_info(config_entry)
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    @property
-    def native_value(self) -> str:
-        """Return the state of the sensor."""
-        return self._change_date
-
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return additional attributes."""
-        return {
+        # A new change date reloads the entry, which recreates this sensor
+        self._attr_native_value = change_date
+        self._attr_extra_state_attributes = {
             "source": "schedule_period_api",
         }
 
@@ -596,8 +676,10 @@ class WasteSensorsListSensor(CoordinatorEntity, SensorEntity):
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._hass = hass
         self._config_entry = config_entry
+        # Filled by async_setup_entry before this sensor is created; the list
+        # is replaced on reload, together with this sensor
+        self._sensor_list: List[str] = hass.data[DOMAIN][config_entry.entry_id]["sensor_list"]
         self._attr_name = "Waste sensors"
         self._attr_unique_id = f"{config_entry.entry_id}_waste_sensors_list"
         self._attr_icon = "mdi:format-list-bulleted"
@@ -608,15 +690,13 @@ class WasteSensorsListSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> int:
         """Return the count of sensors."""
-        sensor_list = self._hass.data[DOMAIN][self._config_entry.entry_id].get("sensor_list", [])
-        return len(sensor_list)
+        return len(self._sensor_list)
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return the list of sensor entity IDs."""
-        sensor_list = self._hass.data[DOMAIN][self._config_entry.entry_id].get("sensor_list", [])
         return {
-            "entity_ids": sensor_list,
+            "entity_ids": list(self._sensor_list),
         }
 
 
@@ -680,27 +760,10 @@ class ConfigurationStatusSensor(SensorEntity):
         self._attr_device_info = get_device_info(config_entry)
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
 
-    @property
-    def native_value(self) -> str:
-        """Return the state of the sensor."""
-        selected_types = self._config_entry.options.get(
-            CONF_SELECTED_WASTE_TYPES,
-            self._config_entry.data.get(CONF_SELECTED_WASTE_TYPES, [])
-        )
-
-        if not selected_types:
-            return "not_selected"
-        return "configured"
-
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return additional attributes."""
-        selected_types = self._config_entry.options.get(
-            CONF_SELECTED_WASTE_TYPES,
-            self._config_entry.data.get(CONF_SELECTED_WASTE_TYPES, [])
-        )
-
-        return {
+        # Options changes reload the entry, so the selection is fixed per entity
+        selected_types = _get_selected_type_ids(config_entry)
+        self._attr_native_value = "configured" if selected_types else "not_selected"
+        self._attr_extra_state_attributes = {
             "selected_count": len(selected_types),
             "selected_type_ids": selected_types,
         }
\ No newline at end of file